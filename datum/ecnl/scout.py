@@ -5,14 +5,12 @@ https://public.totalglobalsports.com/public/event/3064/college-list
 """
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
-import os
 import csv
 import requests
 
-import datum.tgs.event
-
 # from typing import List, Tuple, Optional
 
 
@@ -220,25 +218,27 @@ def get_attending_programs(event_id: int) -> list[Program]:
 
     infos = []
     for item in data["data"]:
-        info = Program(programId=item["collegeInfo"]["collegeprogramID"],
-                       description=item["collegeInfo"]["description"],
-                       collegeId=item["collegeInfo"]["collegeID"],
-                       sportId=item["collegeInfo"]["sportID"],
-                       eventId=item["collegeInfo"]["eventID"],
-                       collegeName=item["collegeInfo"]["collegename"],
-                       city=item["collegeInfo"]["city"],
-                       type=item["collegeInfo"]["type"],
-                       logo=item["collegeInfo"]["logo"],
-                       statecode=item["collegeInfo"]["statecode"],
-                       conferenceName=item["collegeInfo"]["conferencename"],
-                       collegeDivisionId=item["collegeInfo"]["collegeDivisionID"],
-                       collegeDivisionName=item["collegeInfo"]["collegedivisionname"],
-                       gender=item["collegeInfo"]["gender"],
-                       webSite=item["collegeInfo"]["webSite"],
-                       status=item["collegeInfo"]["status"],
-                       publish=item["collegeInfo"]["publish"],
-                       stateId=item["collegeInfo"]["stateID"],
-                       collegeConferenceId=item["collegeInfo"]["collegeConferenceID"],
+        college_info = item["collegeInfo"]
+
+        info = Program(programId=college_info["collegeprogramID"],
+                       description=college_info["description"],
+                       collegeId=college_info["collegeID"],
+                       sportId=college_info["sportID"],
+                       eventId=college_info["eventID"],
+                       collegeName=college_info["collegename"],
+                       city=college_info["city"],
+                       type=college_info["type"],
+                       logo=college_info["logo"],
+                       statecode=college_info["statecode"],
+                       conferenceName=college_info["conferencename"],
+                       collegeDivisionId=college_info["collegeDivisionID"],
+                       collegeDivisionName=college_info["collegedivisionname"],
+                       gender=college_info["gender"],
+                       webSite=college_info["webSite"],
+                       status=college_info["status"],
+                       publish=college_info["publish"],
+                       stateId=college_info["stateID"],
+                       collegeConferenceId=college_info["collegeConferenceID"],
                        coaches=[])
 
         for coach in item["coachList"]:
@@ -274,8 +274,6 @@ def process_event(eventId: int,
                   programs: list[Program],
                   coaches: list[Coach]):
 
-    event_info = datum.tgs.event.get_by_id(eventId)
-
     event = get_event_by_id(eventId)
 
     # Don't add duplicate event names
@@ -284,12 +282,11 @@ def process_event(eventId: int,
 
     programs = get_attending_programs(eventId)
 
+    # Look up known coaches by name instead of rescanning the list for every coach
+    coach_names = {(c.firstName, c.lastName) for c in coaches}
 
     output_file = f"{eventId}_scout.csv"
 
-    if os.path.exists(output_file):
-        os.remove(output_file)
-
     with open(output_file, "w", newline="", encoding="UTF8") as f:
         writer = csv.writer(f)
         writer.writerow(["College Name", "City", "State", "URL", "Name", "Role", "Email", "Phone"])
@@ -307,25 +304,16 @@ def process_event(eventId: int,
                                  coach.email,
                                  coach.phone])
 
-                # Check if event is already in events
-                if not any(e.name == event.name for e in events):
-                    events.append(event)
-
-                # Check if program is already in programs
-                if not any(p.collegeName == program.collegeName for p in programs):
-                    programs.append(program)
-
                 # Check if coach is already in coaches
-                if not any(c.firstName == coach.firstName and c.lastName == coach.lastName for c in coaches):
+                coach_name = (coach.firstName, coach.lastName)
+                if coach_name not in coach_names:
+                    coach_names.add(coach_name)
                     coaches.append(coach)
 
 
 def save_divisions(divisions: list[Division]):
     output_file = "divisions.csv"
 
-    if os.path.exists(output_file):
-        os.remove(output_file)
-
     with open(output_file, "w", newline="", encoding="UTF8") as f:
         writer = csv.writer(f)
         writer.writerow(["ID", "Name"])
@@ -337,9 +325,6 @@ def save_divisions(divisions: list[Division]):
 def save_conferences(conferences: list[Conference]):
     output_file = "conferences.csv"
 
-    if os.path.exists(output_file):
-        os.remove(output_file)
-
     with open(output_file, "w", newline="", encoding="UTF8") as f:
         writer = csv.writer(f)
         writer.writerow(["ID", "Division ID", "Name"])
@@ -350,9 +335,6 @@ def save_conferences(conferences: list[Conference]):
 def save_states(states: list[State]):
     output_file = "states.csv"
 
-    if os.path.exists(output_file):
-        os.remove(output_file)
-
     with open(output_file, "w", newline="", encoding="UTF8") as f:
         writer = csv.writer(f)
         writer.writerow(["ID", "Name", "Code", "Image", "Time Zone ID"])
@@ -364,9 +346,6 @@ def save_states(states: list[State]):
 def save_scouts(states: list[State], divisions: list[Division], conferences: list[Conference], events: list[Event], programs: list[Program], coaches: list[Coach], accumulator: list[tuple[Program, Coach]]):
     output_file = "scout.csv"
 
-    if os.path.exists(output_file):
-        os.remove(output_file)
-
     # Sort the accumulator by college name then by coach name
     accumulator.sort(key=lambda x: (x[0].collegeName, x[1].lastName, x[1].firstName))
 
@@ -392,9 +371,15 @@ if __name__ == "__main__":
     programs = []
     coaches = []
 
-    divisions = get_college_division_list()
-    conferences = get_college_conference_list()
-    states = get_all_states()
+    # The reference lists are independent of each other so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        division_future = executor.submit(get_college_division_list)
+        conference_future = executor.submit(get_college_conference_list)
+        state_future = executor.submit(get_all_states)
+
+    divisions = division_future.result()
+    conferences = conference_future.result()
+    states = state_future.result()
 
     accumulator = []
 
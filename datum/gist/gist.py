@@ -5,33 +5,43 @@ import requests
 
 from dotenv import load_dotenv
 
-# Load the environment variables
-load_dotenv()
-
-# Your GitHub token
-token = os.getenv('GITHUB_TOKEN')
-
 # The API URL for creating gists
 url = 'https://api.github.com/gists'
 
-# The headers for the API request
-headers = {
-    'Authorization': f'token {token}',
-    'Accept': 'application/vnd.github.v3+json',
-}
-
-# The data for the gist
-data = {
-    'public': True,
-    'files': {
-        'test.txt': {
-            'content': 'Hello, world!'
-        }
+
+def create_gist(token: str, files: dict, public: bool = True) -> str:
+    """
+    Create a gist from the specified files
+
+    :param token: A GitHub token allowed to create gists
+    :param files: A mapping of file names to their content
+    :param public: Whether the gist should be public
+    :return: The URL of the created gist
+    """
+    # The headers for the API request
+    headers = {
+        'Authorization': f'token {token}',
+        'Accept': 'application/vnd.github.v3+json',
+    }
+
+    # The data for the gist
+    data = {
+        'public': public,
+        'files': {name: {'content': content} for name, content in files.items()}
     }
-}
 
-# Send the API request
-response = requests.post(url, headers=headers, data=json.dumps(data), timeout=10)
+    # Send the API request
+    response = requests.post(url, headers=headers, data=json.dumps(data), timeout=10)
+
+    return response.json()['html_url']
+
+
+if __name__ == "__main__":
+    # Load the environment variables
+    load_dotenv()
+
+    # Your GitHub token
+    token = os.getenv('GITHUB_TOKEN')
 
-# Print the URL of the created gist
-print(response.json()['html_url'])
+    # Print the URL of the created gist
+    print(create_gist(token, {'test.txt': 'Hello, world!'}))
@@ -32,24 +32,30 @@ if __name__ == "__main__":
     log_file = "index.log"
     index_file = "../data/index.csv"
 
-    if os.path.isfile(log_file):
-        os.remove(log_file)
-
-    logging.basicConfig(filename=log_file, level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    logging.basicConfig(filename=log_file, filemode="w", level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     logger.info("Starting ...")
 
     if not os.path.isfile(index_file):
         sys.exit(f"{index_file} not found.")
 
     with open(index_file, "r", encoding="UTF8") as file:
-        reader = csv.DictReader(file)
-        headings = reader.fieldnames
+        reader = csv.reader(file)
+        headings = next(reader)
+
+        # Resolve the column positions once instead of building a dict for every row
+        short_name_index = headings.index("Short Name")
+        long_name_index = headings.index("Long Name")
+        vendor_index = headings.index("Vendor")
+        womens_soccer_url_index = headings.index("WOSO URL")
 
         for row in reader:
-            short_name = row["Short Name"].strip()
-            long_name = row["Long Name"].strip()
-            vendor = row["Vendor"].strip()
-            womens_soccer_url = row["WOSO URL"].strip()
+            if not row:
+                continue
+
+            short_name = row[short_name_index].strip()
+            long_name = row[long_name_index].strip()
+            vendor = row[vendor_index].strip()
+            womens_soccer_url = row[womens_soccer_url_index].strip()
 
             if vendor == "None":
                 logger.info("Skipping '%s' because vendor is None.", long_name)
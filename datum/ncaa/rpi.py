@@ -1,4 +1,3 @@
-import os
 import csv
 import requests
 
@@ -109,9 +108,6 @@ if __name__ == "__main__":
     for row in rows:
         schools.append(factory.create_school(row))
 
-    if os.path.isfile("rpi.csv"):
-        os.remove("rpi.csv")
-
     with open("rpi.csv", "w", newline="") as file:
         writer = csv.writer(file)
         writer.writerow(["Rank", "Name", "Conference", "Record", "Road", "Neutral", "Home", "Non-Div 1"])
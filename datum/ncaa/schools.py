@@ -5,14 +5,81 @@ import concurrent.futures
 import threading
 
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse, urljoin
 from typing import List, Tuple
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Executor, ThreadPoolExecutor
 
 SCHOOLS_INDEX_URL = "https://www.ncaa.com/schools-index"
 
 print_lock = threading.Lock()
 
+# Same size as the ThreadPoolExecutor default, made explicit so the connection pool can match it
+PAGE_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# As many HEAD checks can run at once as when every page worker sent its own checks inline
+HEAD_WORKERS = PAGE_WORKERS
+
+# Page workers and HEAD checks can all be in flight at the same time
+MAX_CONNECTIONS = PAGE_WORKERS + HEAD_WORKERS
+
+# Shared by every worker thread so connections to ncaa.com are kept alive and reused
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=MAX_CONNECTIONS))
+
+STATE_MAP = {
+    "AL": "Alabama",
+    "AK": "Alaska",
+    "AZ": "Arizona",
+    "AR": "Arkansas",
+    "CA": "California",
+    "CO": "Colorado",
+    "CT": "Connecticut",
+    "DE": "Delaware",
+    "FL": "Florida",
+    "GA": "Georgia",
+    "HI": "Hawaii",
+    "ID": "Idaho",
+    "IL": "Illinois",
+    "IN": "Indiana",
+    "IA": "Iowa",
+    "KS": "Kansas",
+    "KY": "Kentucky",
+    "LA": "Louisiana",
+    "ME": "Maine",
+    "MD": "Maryland",
+    "MA": "Massachusetts",
+    "MI": "Michigan",
+    "MN": "Minnesota",
+    "MS": "Mississippi",
+    "MO": "Missouri",
+    "MT": "Montana",
+    "NE": "Nebraska",
+    "NV": "Nevada",
+    "NH": "New Hampshire",
+    "NJ": "New Jersey",
+    "NM": "New Mexico",
+    "NY": "New York",
+    "NC": "North Carolina",
+    "ND": "North Dakota",
+    "OH": "Ohio",
+    "OK": "Oklahoma",
+    "OR": "Oregon",
+    "PA": "Pennsylvania",
+    "RI": "Rhode Island",
+    "SC": "South Carolina",
+    "SD": "South Dakota",
+    "TN": "Tennessee",
+    "TX": "Texas",
+    "UT": "Utah",
+    "VT": "Vermont",
+    "VA": "Virginia",
+    "WA": "Washington",
+    "WV": "West Virginia",
+    "WI": "Wisconsin",
+    "WY": "Wyoming"
+}
+
 
 class School:
     short_name: str
@@ -83,64 +150,11 @@ class School:
 
 
 def short_to_long_state(short_state: str) -> str:
-    state_map = {
-        "AL": "Alabama",
-        "AK": "Alaska",
-        "AZ": "Arizona",
-        "AR": "Arkansas",
-        "CA": "California",
-        "CO": "Colorado",
-        "CT": "Connecticut",
-        "DE": "Delaware",
-        "FL": "Florida",
-        "GA": "Georgia",
-        "HI": "Hawaii",
-        "ID": "Idaho",
-        "IL": "Illinois",
-        "IN": "Indiana",
-        "IA": "Iowa",
-        "KS": "Kansas",
-        "KY": "Kentucky",
-        "LA": "Louisiana",
-        "ME": "Maine",
-        "MD": "Maryland",
-        "MA": "Massachusetts",
-        "MI": "Michigan",
-        "MN": "Minnesota",
-        "MS": "Mississippi",
-        "MO": "Missouri",
-        "MT": "Montana",
-        "NE": "Nebraska",
-        "NV": "Nevada",
-        "NH": "New Hampshire",
-        "NJ": "New Jersey",
-        "NM": "New Mexico",
-        "NY": "New York",
-        "NC": "North Carolina",
-        "ND": "North Dakota",
-        "OH": "Ohio",
-        "OK": "Oklahoma",
-        "OR": "Oregon",
-        "PA": "Pennsylvania",
-        "RI": "Rhode Island",
-        "SC": "South Carolina",
-        "SD": "South Dakota",
-        "TN": "Tennessee",
-        "TX": "Texas",
-        "UT": "Utah",
-        "VT": "Vermont",
-        "VA": "Virginia",
-        "WA": "Washington",
-        "WV": "West Virginia",
-        "WI": "Wisconsin",
-        "WY": "Wyoming"
-    }
-
-    return state_map.get(short_state, "Unknown")
+    return STATE_MAP.get(short_state, "Unknown")
 
 
 def generate_page_urls(url: str) -> List[str]:
-    response = requests.get(url)
+    response = session.get(url)
     soup = BeautifulSoup(response.text, 'html.parser')
 
     last_page_link = soup.find('a', string='Last »')
@@ -157,7 +171,7 @@ def generate_page_urls(url: str) -> List[str]:
     return urls
 
 
-def process_url(url: str, max_retries: int) -> List[School]:
+def process_url(url: str, max_retries: int, head_executor: Executor | None = None) -> List[School]:
     for _ in range(max_retries):
         try:
             with print_lock:
@@ -166,12 +180,15 @@ def process_url(url: str, max_retries: int) -> List[School]:
             schools = []
 
             # For each page extract the school information
-            response = requests.get(url)
+            response = session.get(url)
             soup = BeautifulSoup(response.text, 'html.parser')
 
             table = soup.find('table', class_='responsive-enabled')
             rows = table.find_all('tr')
 
+            # Test to see if the urls seem valid in the background while the rows are parsed
+            loadable_checks = []
+
             for row in rows:
                 cells = row.find_all('td')
 
@@ -189,11 +206,16 @@ def process_url(url: str, max_retries: int) -> List[School]:
                 if len(current_school.long_name) == 0:
                     current_school.long_name = current_school.short_name
 
-                # Test to see if the url seems valid
-                current_school.loadable = requests.head(current_school.ncaa_url).status_code == 200
+                if head_executor is None:
+                    current_school.loadable = session.head(current_school.ncaa_url).status_code == 200
+                else:
+                    loadable_checks.append((current_school, head_executor.submit(session.head, current_school.ncaa_url)))
 
                 schools.append(current_school)
 
+            for current_school, check in loadable_checks:
+                current_school.loadable = check.result().status_code == 200
+
             return schools
         except requests.exceptions.RequestException:
             continue
@@ -204,8 +226,8 @@ def process_url(url: str, max_retries: int) -> List[School]:
 def get_schools(urls: List[str], max_retries: int = 3) -> Tuple[List[School], List[str]]:
     schools = []
     failed_urls = []
-    with ThreadPoolExecutor() as executor:
-        future_to_url = {executor.submit(process_url, url, max_retries): url for url in urls}
+    with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as executor, ThreadPoolExecutor(max_workers=HEAD_WORKERS) as head_executor:
+        future_to_url = {executor.submit(process_url, url, max_retries, head_executor): url for url in urls}
         for future in concurrent.futures.as_completed(future_to_url):
             url = future_to_url[future]
             try:
@@ -222,7 +244,7 @@ def load_school_details(school: School):
     if not school.is_loadable():
         return
 
-    response = requests.get(school.ncaa_url)
+    response = session.get(school.ncaa_url)
 
     if response.status_code != 200:
         with print_lock:
@@ -263,15 +285,12 @@ def load_school_details(school: School):
     school.normalize()
 
 def populate_schools(schools: List[School]):
-    with ThreadPoolExecutor() as executor:
+    with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as executor:
         # Use map to load all school details in parallel
         executor.map(load_school_details, schools)
 
 
 if __name__ == "__main__":
-    if os.path.isfile("schools.csv"):
-        os.remove("schools.csv")
-
     urls = generate_page_urls(SCHOOLS_INDEX_URL)
 
     schools, failed_urls = get_schools(urls, max_retries=3)
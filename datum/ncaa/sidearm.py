@@ -11,6 +11,15 @@ from urllib.parse import urlparse, urljoin
 
 SIDEARM_URL = "https://sidearmsports.com"
 
+# Matched against the raw response body so detection doesn't have to decode the page
+SIDEARM_MARKER = SIDEARM_URL.encode("ascii")
+
+# Reused by every request so repeated roster and detection calls share keep-alive connections
+session = requests.Session()
+
+# Detection results keyed by hostname
+sidearm_hosts: dict[str, bool] = {}
+
 YEAR_TRANSLATION = {
     "Fr.": "Freshman",
     "So.": "Sophomore",
@@ -49,10 +58,34 @@ class Player:
         return f"'{self.name}' ({self.year}) '{self.position}' from '{self.hometown}'"
 
 
+def is_sidearmsports_content(content: bytes) -> bool:
+    return SIDEARM_MARKER in content
+
+
+def _detect_sidearm(hostname: str, resp: requests.Response) -> bool:
+    is_sidearm = is_sidearmsports_content(resp.content)
+
+    # Error pages (429, 5xx, ...) say nothing about the vendor so they are never cached
+    if resp.status_code == 200:
+        sidearm_hosts[hostname] = is_sidearm
+
+    return is_sidearm
+
+
+def clear_vendor_cache():
+    sidearm_hosts.clear()
+
+
 def is_sidearmsports_page(target_url: str) -> bool:
-    resp = requests.get(target_url)
+    # A site is either built on Sidearm or it isn't, so only the first page per host is fetched
+    hostname = urlparse(target_url).netloc
+
+    if hostname in sidearm_hosts:
+        return sidearm_hosts[hostname]
+
+    resp = session.get(target_url)
 
-    return SIDEARM_URL in resp.text
+    return _detect_sidearm(hostname, resp)
 
 
 def read_player(el: element, prefix: str) -> Player:
@@ -104,11 +137,19 @@ def get_prefix(target_url: str) -> str:
 
 
 def read_players(target_url: str) -> dict:
-    if not is_sidearmsports_page(target_url):
+    hostname = urlparse(target_url).netloc
+
+    # Hosts already known not to be Sidearm are rejected without downloading anything
+    if sidearm_hosts.get(hostname) is False:
+        raise ValueError("Not a Sidearm Sports page")
+
+    response = session.get(target_url)
+
+    # Check the roster page that was just downloaded instead of requesting it twice
+    if not _detect_sidearm(hostname, response):
         raise ValueError("Not a Sidearm Sports page")
 
     results = {}
-    response = requests.get(target_url)
     soup = BeautifulSoup(response.text, 'html.parser')
 
     url_prefix = get_prefix(target_url)
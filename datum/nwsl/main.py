@@ -18,9 +18,7 @@ def get_schools_to_players() -> Dict[str, List[str]]:
     school_to_players = {}
 
     with open('schools.txt', 'r') as file:
-        lines = file.readlines()
-
-        for line in lines:
+        for line in file:
             line = line.strip()
             if ':' in line:
                 player_name, schools = line.split(':')
@@ -74,8 +72,7 @@ def get_nwsl_players() -> List[Player]:
 
 def write_player_names_to_file(players: List[Player]):
     with open('names.txt', 'w') as file:
-        for player in players:
-            file.write(player.Name.strip() + '\n')
+        file.writelines(f"{player.Name.strip()}\n" for player in players)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,37 @@
 import os
 import csv
+
+from collections.abc import Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
+
 import requests
 
 
 URL = "https://www.soccerwire.com/wp-json/v1/elastic-proxy/soccerwirecom-post-1/_search"
 
+PAGE_SIZE = 500
+
+PAGE_WORKERS = 8
+
+EXPORT_WORKERS = 4
+
+# Only the document fields read by _translate_player are requested from the search index
+SOURCE_FIELDS = [
+    "ID",
+    "post_title",
+    "permalink",
+    "meta.image",
+    "meta.positions",
+    "meta.high_school",
+    "meta.rating_player",
+    "meta.graduation_year",
+    "meta.birthplace_city",
+    "meta.state_province",
+    "custom_fields.club_title",
+    "custom_fields.college_team",
+    "custom_fields.college_link"
+]
+
 
 class Player:
     id: str
@@ -30,9 +57,10 @@ class Player:
         return self.__str__()
 
 
-def build_payload(gender: str, year: str, size: int = 0):
+def build_payload(gender: str, year: str, size: int = 0, start: int = 0):
     return {
         "size": size,
+        "_source": SOURCE_FIELDS,
         "post_filter": {
             "bool": {
                 "must": [
@@ -68,6 +96,9 @@ def build_payload(gender: str, year: str, size: int = 0):
         "sort": [
             {
                 "meta.is_featured.raw": "desc"
+            },
+            {
+                "ID": "asc"
             }
         ],
         "query": {
@@ -84,18 +115,55 @@ def build_payload(gender: str, year: str, size: int = 0):
                 }
             }
         },
-        "from": 0
+        "from": start
     }
 
 
 def get_number_of_commitments(gender: str, year: str) -> int:
     payload = build_payload(gender, year, 0)
-    response = requests.post(URL, json=payload)
+    response = requests.post(URL, json=payload, timeout=10)
     data = response.json()
 
     return data["hits"]["total"]
 
 
+def _get_commitment_page(gender: str, year: str, start: int, size: int) -> list:
+    payload = build_payload(gender, year, size, start)
+    response = requests.post(URL, json=payload, timeout=10)
+    data = response.json()
+
+    return data["hits"]["hits"]
+
+
+def get_commitments(gender: str, year: str, page_size: int = PAGE_SIZE, executor: Executor | None = None) -> Iterator[dict]:
+    """
+    Retrieve all the committed players for a gender and graduation year
+
+    The pages are requested concurrently and yielded in search order as soon as
+    each one arrives, so callers can write rows without holding every page.
+
+    :param gender: The gender of the players ("male" or "female")
+    :param year: The graduation year
+    :param page_size: The number of players requested per page
+    :param executor: The executor that requests the pages, shared by callers that
+                     export several years at once so the total number of requests stays bounded
+    :return: An iterator of search hits
+    """
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as page_executor:
+            yield from get_commitments(gender, year, page_size, page_executor)
+
+        return
+
+    count = get_number_of_commitments(gender, year)
+    starts = range(0, count, page_size)
+
+    pages = executor.map(lambda start: _get_commitment_page(gender, year, start, page_size), starts)
+
+    for page in pages:
+        yield from page
+
+
 # def _get_player_league(player, default="Other"):
 #     club = _get_player_club(player, None)
 #
@@ -383,29 +451,40 @@ def _translate_player(player):
     return translated_player
 
 
+def write_commitments(gender: str, year: str, executor: Executor | None = None) -> None:
+    file_name = f"{gender}.{year}.csv"
+
+    # Rows are streamed into a temporary file that only replaces the previous export once every
+    # page has been written, so a failed request never leaves a partial file behind
+    temp_file_name = f"{file_name}.tmp"
+
+    try:
+        with open(temp_file_name, 'w', newline='') as csvfile:
+            player_writer = csv.writer(csvfile, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL)
+            player_writer.writerow(["Name", "Position", "Club", "High School", "City", "State", "Commitment", "Commitment URL"])
+            for item in get_commitments(gender, year, executor=executor):
+                player = _translate_player(item["_source"])
+                player_writer.writerow([player.name, player.position, player.club, player.high_school, player.city, player.state, player.commitment, player.commitment_url])
+    except BaseException:
+        try:
+            os.remove(temp_file_name)
+        except FileNotFoundError:
+            pass
+
+        raise
+
+    os.replace(temp_file_name, file_name)
+
+
 if __name__ == "__main__":
     genders = ["male", "female"]
     years = ["2020", "2021", "2022", "2023", "2024", "2025", "2026"]
 
-    players = []
-    for gender in genders:
-        for year in years:
-            count = get_number_of_commitments(gender, year)
-            payload = build_payload(gender, year, count)
-            response = requests.post(URL, json=payload)
-            data = response.json()
-
-            file_name = f"{gender}.{year}.csv"
-
-            # if the file exists already delete it
-            try:
-                os.remove(file_name)
-            except FileNotFoundError:
-                pass
-
-            with open(file_name, 'w', newline='') as csvfile:
-                player_writer = csv.writer(csvfile, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL)
-                player_writer.writerow(["Name", "Position", "Club", "High School", "City", "State", "Commitment", "Commitment URL"])
-                for item in data["hits"]["hits"]:
-                    player = _translate_player(item["_source"])
-                    player_writer.writerow([player.name, player.position, player.club, player.high_school, player.city, player.state, player.commitment, player.commitment_url])
+    # Each gender and year is written to its own file so they can be exported concurrently.
+    # The page requests of every export share one pool so at most PAGE_WORKERS pages are in flight.
+    with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as page_executor:
+        with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as executor:
+            futures = [executor.submit(write_commitments, gender, year, page_executor) for gender in genders for year in years]
+
+            for future in futures:
+                future.result()
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import requests
@@ -111,9 +112,7 @@ def _translate_date(date_string: str) -> str:
     return date.strftime("%B %d, %Y")
 
 
-def process_event(event_id: int):
-    event = get_by_id(event_id)
-
+def _print_event(event: dict, colleges_attending: list[tuple[dict, list]]):
     print("-" * 80)
     print(event["name"])
     print(event["location"])
@@ -124,12 +123,18 @@ def process_event(event_id: int):
     print(f"{alpha_date} - {omega_date}")
 
     print("\nColleges Attending")
-    colleges_attending = get_colleges_attending(event_id)
     for college, coaches in colleges_attending:
         print(college["collegename"])
         for coach in coaches:
             print(f"\t{coach['name']}, {coach['email']}, {coach['phone']}")
 
+
+def process_event(event_id: int):
+    event = get_by_id(event_id)
+    colleges_attending = get_colleges_attending(event_id)
+
+    _print_event(event, colleges_attending)
+
 # https://public.totalglobalsports.com/api/Event/get-event-schedule-or-standings/3064
 # https://public.totalglobalsports.com/api/Event/get-event-details-by-eventID/3064
 # https://public.totalglobalsports.com/api/Event/get-flight-division-by-flightID/24867
@@ -139,8 +144,13 @@ def process_event(event_id: int):
 
 
 def process_events(event_ids: list[int]):
-    for event_id in event_ids:
-        process_event(event_id)
+    # Request every event up front and print the results in the original order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        events = executor.map(get_by_id, event_ids)
+        colleges = executor.map(get_colleges_attending, event_ids)
+
+        for event, colleges_attending in zip(events, colleges):
+            _print_event(event, colleges_attending)
 
 
 if __name__ == "__main__":
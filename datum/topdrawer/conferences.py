@@ -1,9 +1,11 @@
-import os
 import csv
-import requests
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Tuple
+
+import requests
+
 from bs4 import BeautifulSoup
 
 GENDERS = ["male", "female"]
@@ -123,9 +125,6 @@ class ConferenceWriter:
     def write(self, gender: str, division: str, conferences: List[Conference]) -> None:
         output_file = f"conferences_{division}_{gender}.csv"
 
-        if os.path.exists(output_file):
-            os.remove(output_file)
-
         with open(output_file, "w") as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(["ID", "Name", "Division", "Gender", "URL"])
@@ -143,10 +142,20 @@ class ProgramReader:
         pass
 
     def read(self, conference: Conference) -> List[Program]:
+        programs, skipped_rows = self.read_with_skipped(conference)
+
+        for row in skipped_rows:
+            print(row)
+
+        return programs
+
+    def read_with_skipped(self, conference: Conference) -> Tuple[List[Program], list]:
+        # Rows without a school link are returned instead of printed so worker threads stay quiet
         response = requests.get(conference.url)
         soup = BeautifulSoup(response.text, 'html.parser')
 
         programs = []
+        skipped_rows = []
 
         columns = soup.find_all("div", class_="col-lg-6")
         for column in columns:
@@ -164,7 +173,7 @@ class ProgramReader:
                 anchor = row.find("a")
 
                 if anchor is None:
-                    print(row)
+                    skipped_rows.append(row)
                     continue
 
                 program.school_name = anchor.text.strip()
@@ -173,7 +182,7 @@ class ProgramReader:
 
                 programs.append(program)
 
-        return programs
+        return programs, skipped_rows
 
 
 if __name__ == "__main__":
@@ -181,13 +190,18 @@ if __name__ == "__main__":
     conference_writer = ConferenceWriter()
     program_reader = ProgramReader()
 
-    for division in DIVISIONS:
-        for gender in GENDERS:
-            conferences = conference_reader.read(gender, division)
-            conference_writer.write(gender, division, conferences)
-
-            for conference in conferences:
-                print(conference)
-                programs = program_reader.read(conference)
-                for program in programs:
-                    print(f"\t{program}")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for division in DIVISIONS:
+            for gender in GENDERS:
+                conferences = conference_reader.read(gender, division)
+                conference_writer.write(gender, division, conferences)
+
+                # Read the standings of every conference concurrently, printing them in order
+                conference_programs = executor.map(program_reader.read_with_skipped, conferences)
+
+                for conference, (programs, skipped_rows) in zip(conferences, conference_programs):
+                    print(conference)
+                    for row in skipped_rows:
+                        print(row)
+                    for program in programs:
+                        print(f"\t{program}")
@@ -1,10 +1,10 @@
-import os
 import csv
 import warnings
 import requests
 
 from urllib3.exceptions import InsecureRequestWarning
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 
 from typing import List, Dict
 
@@ -66,26 +66,27 @@ if __name__ == "__main__":
     institutions = read_institutions('institutions.txt')
 
     output_file = "population_data.csv"
-    if os.path.exists(output_file):
-        os.remove(output_file)
-
     with open(output_file, "w") as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(["Institution", "Population"])
 
-        for institution in institutions:
-            try:
-                data = get_population_data(institution)
-
-                if 'Undergraduate' not in data:
-                    writer.writerow([institution, "Data not found"])
-                else:
-                    population = data['Undergraduate']
-                    writer.writerow([institution, population])
-            except ValueError as e:
-                print(e)
-            except Exception as e:
-                print(e)
+        # Look the institutions up concurrently but write the rows in the original order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(get_population_data, institution) for institution in institutions]
+
+            for institution, future in zip(institutions, futures):
+                try:
+                    data = future.result()
+
+                    if 'Undergraduate' not in data:
+                        writer.writerow([institution, "Data not found"])
+                    else:
+                        population = data['Undergraduate']
+                        writer.writerow([institution, population])
+                except ValueError as e:
+                    print(e)
+                except Exception as e:
+                    print(e)
 
 
 
@@ -0,0 +1,79 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from datum.soccerwire import commitments
+
+
+class FakeResponse:
+    def __init__(self, data: dict):
+        self.data = data
+
+    def json(self):
+        return self.data
+
+
+class FakeSearch:
+    """Serves the requested slice of `total` hits whose IDs are their search positions."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.payloads = []
+
+    def __call__(self, url, json=None, **kwargs):
+        self.payloads.append(json)
+
+        if json["size"] == 0:
+            return FakeResponse({"hits": {"total": self.total, "hits": []}})
+
+        start = json["from"]
+        stop = min(start + json["size"], self.total)
+        hits = [{"_source": {"ID": position}} for position in range(start, stop)]
+
+        return FakeResponse({"hits": {"total": self.total, "hits": hits}})
+
+    def page_payloads(self) -> list:
+        return [payload for payload in self.payloads if payload["size"] > 0]
+
+
+def stub_search(monkeypatch, total: int) -> FakeSearch:
+    fake_search = FakeSearch(total)
+    monkeypatch.setattr(commitments.requests, "post", fake_search)
+    return fake_search
+
+
+@pytest.mark.parametrize("total", [0, 1, 100, 1234])
+def test_get_commitments_returns_every_hit_in_search_order(monkeypatch, total):
+    stub_search(monkeypatch, total)
+
+    hits = list(commitments.get_commitments("female", "2024", page_size=100))
+
+    assert [hit["_source"]["ID"] for hit in hits] == list(range(total))
+
+
+def test_get_commitments_requests_consecutive_page_offsets(monkeypatch):
+    fake_search = stub_search(monkeypatch, 1234)
+
+    list(commitments.get_commitments("female", "2024", page_size=100))
+
+    page_payloads = fake_search.page_payloads()
+    assert sorted(payload["from"] for payload in page_payloads) == list(range(0, 1234, 100))
+    assert all(payload["size"] == 100 for payload in page_payloads)
+
+
+def test_get_commitments_uses_a_shared_executor(monkeypatch):
+    fake_search = stub_search(monkeypatch, 250)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        hits = list(commitments.get_commitments("male", "2025", page_size=100, executor=executor))
+
+    assert [hit["_source"]["ID"] for hit in hits] == list(range(250))
+    assert len(fake_search.page_payloads()) == 3
+
+
+def test_build_payload_sorts_with_an_id_tie_break():
+    payload = commitments.build_payload("female", "2024", 100, 200)
+
+    assert payload["sort"] == [{"meta.is_featured.raw": "desc"}, {"ID": "asc"}]
+    assert payload["from"] == 200
+    assert payload["size"] == 100
@@ -0,0 +1,107 @@
+import pytest
+
+from datum.ncaa import sidearm
+
+SIDEARM_BODY = b'<html><footer><a href="https://sidearmsports.com">Sidearm Sports</a></footer></html>'
+OTHER_BODY = b'<html><footer>Powered by someone else</footer></html>'
+
+ROSTER_URL = "https://example.com/sports/womens-soccer/roster"
+OTHER_ROSTER_URL = "https://example.com/sports/mens-soccer/roster"
+
+
+class FakeResponse:
+    def __init__(self, content: bytes, status_code: int = 200):
+        self.content = content
+        self.status_code = status_code
+        self.text = content.decode("utf-8")
+
+
+class FakeGet:
+    def __init__(self, *responses: FakeResponse):
+        self.responses = list(responses)
+        self.urls = []
+
+    def __call__(self, url, *args, **kwargs):
+        self.urls.append(url)
+        return self.responses.pop(0)
+
+
+@pytest.fixture(autouse=True)
+def empty_vendor_cache():
+    sidearm.clear_vendor_cache()
+    yield
+    sidearm.clear_vendor_cache()
+
+
+def stub_get(monkeypatch, *responses: FakeResponse) -> FakeGet:
+    fake_get = FakeGet(*responses)
+    monkeypatch.setattr(sidearm.session, "get", fake_get)
+    return fake_get
+
+
+@pytest.mark.parametrize("body, expected", [(SIDEARM_BODY, True), (OTHER_BODY, False)])
+def test_is_sidearmsports_page_caches_200_responses_per_host(monkeypatch, body, expected):
+    fake_get = stub_get(monkeypatch, FakeResponse(body))
+
+    assert sidearm.is_sidearmsports_page(ROSTER_URL) is expected
+    assert sidearm.is_sidearmsports_page(OTHER_ROSTER_URL) is expected
+    assert fake_get.urls == [ROSTER_URL]
+
+
+@pytest.mark.parametrize("status_code", [429, 500, 503])
+def test_is_sidearmsports_page_retries_after_error_responses(monkeypatch, status_code):
+    fake_get = stub_get(monkeypatch, FakeResponse(OTHER_BODY, status_code), FakeResponse(SIDEARM_BODY))
+
+    assert sidearm.is_sidearmsports_page(ROSTER_URL) is False
+    assert sidearm.is_sidearmsports_page(ROSTER_URL) is True
+    assert fake_get.urls == [ROSTER_URL, ROSTER_URL]
+
+
+def test_clear_vendor_cache_forgets_hosts(monkeypatch):
+    fake_get = stub_get(monkeypatch, FakeResponse(OTHER_BODY), FakeResponse(SIDEARM_BODY))
+
+    assert sidearm.is_sidearmsports_page(ROSTER_URL) is False
+
+    sidearm.clear_vendor_cache()
+
+    assert sidearm.is_sidearmsports_page(ROSTER_URL) is True
+    assert len(fake_get.urls) == 2
+
+
+def test_read_players_rejects_cached_non_sidearm_host_without_request(monkeypatch):
+    fake_get = stub_get(monkeypatch, FakeResponse(OTHER_BODY))
+    sidearm.is_sidearmsports_page(ROSTER_URL)
+
+    with pytest.raises(ValueError):
+        sidearm.read_players(OTHER_ROSTER_URL)
+
+    assert fake_get.urls == [ROSTER_URL]
+
+
+def test_read_players_rechecks_roster_body_of_cached_sidearm_host(monkeypatch):
+    fake_get = stub_get(monkeypatch, FakeResponse(SIDEARM_BODY), FakeResponse(OTHER_BODY))
+    sidearm.is_sidearmsports_page(ROSTER_URL)
+
+    with pytest.raises(ValueError):
+        sidearm.read_players(OTHER_ROSTER_URL)
+
+    assert fake_get.urls == [ROSTER_URL, OTHER_ROSTER_URL]
+    assert sidearm.sidearm_hosts == {"example.com": False}
+
+
+def test_read_players_fetches_the_roster_once(monkeypatch):
+    fake_get = stub_get(monkeypatch, FakeResponse(SIDEARM_BODY))
+
+    assert not sidearm.read_players(ROSTER_URL)
+    assert fake_get.urls == [ROSTER_URL]
+    assert sidearm.sidearm_hosts == {"example.com": True}
+
+
+def test_read_players_does_not_cache_error_responses(monkeypatch):
+    fake_get = stub_get(monkeypatch, FakeResponse(OTHER_BODY, 503))
+
+    with pytest.raises(ValueError):
+        sidearm.read_players(ROSTER_URL)
+
+    assert fake_get.urls == [ROSTER_URL]
+    assert not sidearm.sidearm_hosts